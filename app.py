@@ -5,18 +5,32 @@ FastAPI Application with SQLite Database
 Integrated with 'schema.sql' for Patients, Visits, Inventory, and Analytics.
 """
 
-from fastapi import FastAPI, HTTPException, Request, Depends, status
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi import FastAPI, HTTPException, Request, Depends, Query, status
+from fastapi.responses import HTMLResponse, JSONResponse, Response, StreamingResponse
 from fastapi.security import OAuth2PasswordBearer
+from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 import sqlite3
 import hashlib
 from datetime import datetime, timedelta
 from typing import List, Optional, Dict, Any
 import secrets
+import zlib
+import re
+import time
 import jwt
 import os
 
+try:
+    import brotli  # Optional: gzip is served when it's missing
+except ImportError:
+    brotli = None
+
+try:
+    import minify_html  # Optional: the shell is served unminified when it's missing
+except ImportError:
+    minify_html = None
+
 # ============================================================
 # CONFIGURATION
 # ============================================================
@@ -25,6 +39,9 @@ DB_PATH = "chamber.db"
 SECRET_KEY = os.getenv("SECRET_KEY", "chamber-ai-super-secret-key-change-in-prod")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24  # 24 hours
+STATS_CACHE_TTL = 30  # seconds
+PAGE_SIZE = 40  # Rows per list page; the SPA asks for this many
+MAX_PAGE_SIZE = 200  # Upper bound on ?limit= so no request reads a whole table
 
 app = FastAPI(
     title="Jahan Health Care",
@@ -49,9 +66,105 @@ def get_db():
     conn.row_factory = sqlite3.Row
     return conn
 
+def like_prefix(q: str) -> str:
+    """LIKE pattern matching q literally as a prefix; pair it with ESCAPE '\\' in the query"""
+    return q.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+
 def hash_password(password: str) -> str:
     return hashlib.sha256(password.encode()).hexdigest()
 
+# Lookup indexes that schema.sql doesn't define; NOCASE so prefix LIKE searches can use them
+INDEXES = [
+    "CREATE INDEX IF NOT EXISTS idx_patients_name_nocase ON patients(name COLLATE NOCASE)",
+    "CREATE INDEX IF NOT EXISTS idx_patients_phone_nocase ON patients(phone COLLATE NOCASE)",
+    "CREATE INDEX IF NOT EXISTS idx_remedies_name_nocase ON remedies(name COLLATE NOCASE)",
+]
+
+def ensure_indexes():
+    conn = get_db()
+    try:
+        for ddl in INDEXES:
+            conn.execute(ddl)
+        conn.commit()
+    except Exception as e:
+        print(f"❌ Index creation failed: {e}")
+    finally:
+        conn.close()
+
+# Chatbot fast-path objects; ml_service.ChatService only reads them and falls back when one is missing.
+# source table -> (object whose presence marks the script as applied, script). Every statement is
+# idempotent, so a partial earlier run or a second process starting at the same time just reapplies it.
+CHAT_SCHEMA = {
+    # NOCASE index so a prefix LIKE becomes a range seek, plus an external-content FTS5 token index
+    # over medicines.name kept in step by triggers
+    "medicines": ("medicines_fts_au", """
+BEGIN IMMEDIATE;
+CREATE INDEX IF NOT EXISTS idx_medicines_name_nocase ON medicines(name COLLATE NOCASE);
+CREATE VIRTUAL TABLE IF NOT EXISTS medicines_fts USING fts5(name, content='medicines', content_rowid='id');
+CREATE TRIGGER IF NOT EXISTS medicines_fts_ai AFTER INSERT ON medicines BEGIN
+    INSERT INTO medicines_fts(rowid, name) VALUES (new.id, new.name);
+END;
+CREATE TRIGGER IF NOT EXISTS medicines_fts_ad AFTER DELETE ON medicines BEGIN
+    INSERT INTO medicines_fts(medicines_fts, rowid, name) VALUES ('delete', old.id, old.name);
+END;
+CREATE TRIGGER IF NOT EXISTS medicines_fts_au AFTER UPDATE OF name ON medicines BEGIN
+    INSERT INTO medicines_fts(medicines_fts, rowid, name) VALUES ('delete', old.id, old.name);
+    INSERT INTO medicines_fts(rowid, name) VALUES (new.id, new.name);
+END;
+INSERT INTO medicines_fts(medicines_fts) VALUES ('rebuild');
+COMMIT;
+"""),
+    # Running totals for the revenue/patient-count intents: one PK lookup instead of a full-table aggregate
+    "sales": ("summary_sales_au", """
+BEGIN IMMEDIATE;
+CREATE TABLE IF NOT EXISTS summary_stats (key TEXT PRIMARY KEY, value REAL NOT NULL);
+INSERT OR REPLACE INTO summary_stats (key, value) VALUES ('total_revenue', (SELECT COALESCE(SUM(amount), 0) FROM sales));
+CREATE TRIGGER IF NOT EXISTS summary_sales_ai AFTER INSERT ON sales BEGIN
+    UPDATE summary_stats SET value = value + COALESCE(new.amount, 0) WHERE key = 'total_revenue';
+END;
+CREATE TRIGGER IF NOT EXISTS summary_sales_ad AFTER DELETE ON sales BEGIN
+    UPDATE summary_stats SET value = value - COALESCE(old.amount, 0) WHERE key = 'total_revenue';
+END;
+CREATE TRIGGER IF NOT EXISTS summary_sales_au AFTER UPDATE OF amount ON sales BEGIN
+    UPDATE summary_stats SET value = value + COALESCE(new.amount, 0) - COALESCE(old.amount, 0) WHERE key = 'total_revenue';
+END;
+COMMIT;
+"""),
+    "patients": ("summary_patients_ad", """
+BEGIN IMMEDIATE;
+CREATE TABLE IF NOT EXISTS summary_stats (key TEXT PRIMARY KEY, value REAL NOT NULL);
+INSERT OR REPLACE INTO summary_stats (key, value) VALUES ('patient_count', (SELECT COUNT(*) FROM patients));
+CREATE TRIGGER IF NOT EXISTS summary_patients_ai AFTER INSERT ON patients BEGIN
+    UPDATE summary_stats SET value = value + 1 WHERE key = 'patient_count';
+END;
+CREATE TRIGGER IF NOT EXISTS summary_patients_ad AFTER DELETE ON patients BEGIN
+    UPDATE summary_stats SET value = value - 1 WHERE key = 'patient_count';
+END;
+COMMIT;
+"""),
+}
+
+def ensure_chat_schema():
+    conn = get_db()
+    try:
+        # WAL so the chatbot's long-lived read connection never blocks API writes
+        conn.execute("PRAGMA journal_mode=WAL")
+        for table, (marker, script) in CHAT_SCHEMA.items():
+            if conn.execute("SELECT 1 FROM sqlite_master WHERE name = ?", (marker,)).fetchone():
+                continue
+            if not conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)).fetchone():
+                continue
+            try:
+                conn.executescript(script)
+            except sqlite3.Error as e:
+                if conn.in_transaction:
+                    conn.rollback()
+                print(f"❌ Chat schema for {table} failed: {e}")
+    except sqlite3.Error as e:
+        print(f"❌ Chat schema setup failed: {e}")
+    finally:
+        conn.close()
+
 def init_database():
     """Initialize database and seed admin user"""
     # 1. Create Tables if DB doesn't exist OR tables are missing
@@ -129,6 +242,10 @@ def init_database():
     finally:
         conn.close()
 
+    # 3. Indexes and chatbot objects (idempotent, so existing databases pick them up too)
+    ensure_indexes()
+    ensure_chat_schema()
+
 
 
 
@@ -208,8 +325,10 @@ def create_patient(patient: dict, user: dict = Depends(get_current_user)):
             user['id']
         ))
         conn.commit()
+        invalidate_stats()
         pid = cursor.lastrowid
-        return {"id": pid, "message": "Patient created successfully"}
+        row = conn.execute("SELECT * FROM patients WHERE id = ?", (pid,)).fetchone()
+        return {"id": pid, "message": "Patient created successfully", "patient": dict(row)}
     except sqlite3.IntegrityError as e:
         raise HTTPException(status_code=400, detail=f"Database error: {str(e)}")
     finally:
@@ -248,16 +367,31 @@ def update_patient(patient_id: int, patient: dict, user: dict = Depends(get_curr
             patient_id
         ))
         conn.commit()
-        return {"message": "Patient updated successfully"}
+        row = conn.execute("SELECT * FROM patients WHERE id = ?", (patient_id,)).fetchone()
+        return {"message": "Patient updated successfully", "patient": dict(row)}
     except sqlite3.IntegrityError as e:
         raise HTTPException(status_code=400, detail=f"Database error: {str(e)}")
     finally:
         conn.close()
 
 @app.get("/api/patients")
-def list_patients(user: dict = Depends(get_current_user)):
+def list_patients(q: Optional[str] = None, limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+                  after: Optional[int] = None, user: dict = Depends(get_current_user)):
     conn = get_db()
-    patients = conn.execute("SELECT * FROM patients ORDER BY created_at DESC").fetchall()
+    if q:
+        # Prefix match on name/phone so the NOCASE indexes serve the lookup
+        patients = conn.execute(
+            "SELECT * FROM patients WHERE name LIKE ?1 ESCAPE '\\' OR phone LIKE ?1 ESCAPE '\\' ORDER BY name LIMIT ?2",
+            (like_prefix(q), limit or 20)
+        ).fetchall()
+    else:
+        # Keyset pagination: `after` is the last id of the previous page
+        patients = conn.execute("""
+            SELECT * FROM patients
+            WHERE ?1 IS NULL OR (created_at, id) < (SELECT created_at, id FROM patients WHERE id = ?1)
+            ORDER BY created_at DESC, id DESC
+            LIMIT ?2
+        """, (after, limit or PAGE_SIZE)).fetchall()
     conn.close()
     return [dict(row) for row in patients]
 
@@ -282,7 +416,9 @@ def create_remedy(remedy: dict, user: dict = Depends(get_current_user)):
             remedy.get('stock_quantity', 0)
         ))
         conn.commit()
-        return {"id": cursor.lastrowid, "message": "Remedy added"}
+        invalidate_stats()
+        row = conn.execute("SELECT * FROM remedies WHERE id = ?", (cursor.lastrowid,)).fetchone()
+        return {"id": cursor.lastrowid, "message": "Remedy added", "remedy": dict(row)}
     finally:
         conn.close()
 
@@ -306,14 +442,30 @@ def update_remedy(remedy_id: int, remedy: dict, user: dict = Depends(get_current
             remedy_id
         ))
         conn.commit()
-        return {"message": "Remedy updated"}
+        row = conn.execute("SELECT * FROM remedies WHERE id = ?", (remedy_id,)).fetchone()
+        return {"message": "Remedy updated", "remedy": dict(row) if row else None}
     finally:
         conn.close()
 
 @app.get("/api/remedies")
-def list_remedies(user: dict = Depends(get_current_user)):
+def list_remedies(q: Optional[str] = None, limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+                  after: Optional[int] = None, after_name: Optional[str] = None,
+                  user: dict = Depends(get_current_user)):
     conn = get_db()
-    rows = conn.execute("SELECT * FROM remedies ORDER BY name").fetchall()
+    if q:
+        rows = conn.execute(
+            "SELECT * FROM remedies WHERE name LIKE ? ESCAPE '\\' ORDER BY name LIMIT ?",
+            (like_prefix(q), limit or 50)
+        ).fetchall()
+    else:
+        # Keyset pagination, same contract as /api/patients. Names are editable, so the client
+        # sends the cursor row's name as it was paged; the lookup by id is only a fallback.
+        rows = conn.execute("""
+            SELECT * FROM remedies
+            WHERE ?1 IS NULL OR (name, id) > (COALESCE(?3, (SELECT name FROM remedies WHERE id = ?1)), ?1)
+            ORDER BY name, id
+            LIMIT ?2
+        """, (after, limit or PAGE_SIZE, after_name)).fetchall()
     conn.close()
     return [dict(row) for row in rows]
 
@@ -321,6 +473,26 @@ def list_remedies(user: dict = Depends(get_current_user)):
 # API ENDPOINTS - VISITS
 # ============================================================
 
+# Join with patients AND payments to show full details
+VISIT_SELECT = """
+    SELECT 
+        v.*, 
+        p.name as patient_name,
+        pay.total_bill,
+        pay.amount_paid,
+        pay.due_amount,
+        pay.status as payment_status,
+        pay.consultation_fee,
+        pay.medicine_bill
+    FROM visits v 
+    JOIN patients p ON v.patient_id = p.id 
+    LEFT JOIN payments pay ON pay.visit_id = v.id
+"""
+
+def get_visit_row(conn, visit_id):
+    row = conn.execute(VISIT_SELECT + " WHERE v.id = ?", (visit_id,)).fetchone()
+    return dict(row) if row else None
+
 @app.post("/api/visits")
 def create_visit(visit: dict, user: dict = Depends(get_current_user)):
     conn = get_db()
@@ -404,7 +576,9 @@ def create_visit(visit: dict, user: dict = Depends(get_current_user)):
         ))
 
         conn.commit()
-        return {"id": visit_id, "message": "Visit recorded", "total": total_bill, "due": due_amount, "status": status}
+        invalidate_stats()
+        return {"id": visit_id, "message": "Visit recorded", "total": total_bill, "due": due_amount, "status": status,
+                "visit": get_visit_row(conn, visit_id)}
         
     except HTTPException as he:
         raise he
@@ -415,25 +589,15 @@ def create_visit(visit: dict, user: dict = Depends(get_current_user)):
         conn.close()
 
 @app.get("/api/visits")
-def list_visits(user: dict = Depends(get_current_user)):
+def list_visits(limit: int = Query(PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE), after: Optional[int] = None,
+                user: dict = Depends(get_current_user)):
     conn = get_db()
-    # Join with patients AND payments to show full details
-    query = """
-        SELECT 
-            v.*, 
-            p.name as patient_name,
-            pay.total_bill,
-            pay.amount_paid,
-            pay.due_amount,
-            pay.status as payment_status,
-            pay.consultation_fee,
-            pay.medicine_bill
-        FROM visits v 
-        JOIN patients p ON v.patient_id = p.id 
-        LEFT JOIN payments pay ON pay.visit_id = v.id
-        ORDER BY v.visit_date DESC
+    query = VISIT_SELECT + """
+        WHERE ?1 IS NULL OR (v.visit_date, v.id) < (SELECT visit_date, id FROM visits WHERE id = ?1)
+        ORDER BY v.visit_date DESC, v.id DESC
+        LIMIT ?2
     """
-    rows = conn.execute(query).fetchall()
+    rows = conn.execute(query, (after, limit)).fetchall()
     conn.close()
     return [dict(row) for row in rows]
 
@@ -469,7 +633,7 @@ def update_payment(visit_id: int, payment: dict, user: dict = Depends(get_curren
             WHERE visit_id=?
         """, (consult, med_bill, total, paid, due, status, visit_id))
         conn.commit()
-        return {"message": "Payment updated"}
+        return {"message": "Payment updated", "visit": get_visit_row(conn, visit_id)}
     finally:
         conn.close()
 
@@ -496,8 +660,21 @@ def report_revenue(user: dict = Depends(get_current_user)):
     finally:
         conn.close()
 
+# Dashboard counters change on a human timescale; cache them and drop the cache on inserts
+# "generation" moves on every invalidation, so a computation that raced a write isn't stored
+_stats_cache = {"data": None, "expires": 0.0, "generation": 0}
+
+def invalidate_stats():
+    _stats_cache["data"] = None
+    _stats_cache["generation"] += 1
+
 @app.get("/api/stats")
 def dashboard_stats(user: dict = Depends(get_current_user)):
+    now = time.monotonic()
+    if _stats_cache["data"] is not None and now < _stats_cache["expires"]:
+        return _stats_cache["data"]
+
+    generation = _stats_cache["generation"]
     conn = get_db()
     stats = {
         "patients": conn.execute("SELECT COUNT(*) as c FROM patients").fetchone()['c'],
@@ -506,30 +683,63 @@ def dashboard_stats(user: dict = Depends(get_current_user)):
         "today_visits": conn.execute("SELECT COUNT(*) as c FROM visits WHERE DATE(visit_date) = DATE('now')").fetchone()['c']
     }
     conn.close()
+    if _stats_cache["generation"] == generation:
+        _stats_cache.update(data=stats, expires=now + STATS_CACHE_TTL)
     return stats
 
+@app.get("/api/bootstrap")
+def bootstrap(limit: int = Query(PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE), user: dict = Depends(get_current_user)):
+    """Everything the SPA shows on login in one round trip (and one token check)"""
+    return {
+        "stats": dashboard_stats(user=user),
+        "patients": list_patients(limit=limit, user=user),
+        "remedies": list_remedies(limit=limit, user=user),
+        "visits": list_visits(limit=limit, user=user),
+        "history": report_history(user=user)
+    }
+
 # ============================================================
 # STATIC FRONTEND
 # ============================================================
 
-@app.get("/", response_class=HTMLResponse)
-def serve_app():
-    return """
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles with Cache-Control: content-hashed files never change, everything else revalidates"""
+    HASHED_NAME = re.compile(r"\.[0-9a-f]{8,}\.\w+$")
+
+    def file_response(self, full_path, stat_result, scope, status_code=200):
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        if self.HASHED_NAME.search(str(full_path)):
+            response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        else:
+            response.headers["Cache-Control"] = "public, max-age=300"
+        return response
+
+app.mount("/static", CachedStaticFiles(directory="static"), name="static")
+
+INDEX_HTML = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Chamber AI Manager</title>
+    <!-- The icon font is only discovered once fa-sub.css is parsed; start fetching it up front -->
+    <link rel="preload" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/webfonts/fa-solid-900.woff2" as="font" type="font/woff2" crossorigin>
     <script src="https://cdn.tailwindcss.com"></script>
-    <script src="https://unpkg.com/vue@3/dist/vue.global.js"></script>
-    <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css" rel="stylesheet">
+    <script src="https://unpkg.com/vue@3/dist/vue.global.prod.js"></script>
+    <link href="/static/fa-sub.css" rel="stylesheet">
     <style>
         /* Custom scrollbar for webkit */
         ::-webkit-scrollbar { width: 8px; }
         ::-webkit-scrollbar-track { background: #f0fdf4; }
         ::-webkit-scrollbar-thumb { background: #166534; border-radius: 4px; }
         ::-webkit-scrollbar-thumb:hover { background: #14532d; }
+
+        /* Low-stock badge (inventory): a single boolean class instead of swapping class strings per card */
+        .stock-badge.low-stock { color: #ef4444; background-color: #fef2f2; font-weight: 700; }
+
+        /* Long lists: let the browser skip layout/paint for cards scrolled out of view */
+        .offscreen-skip { content-visibility: auto; contain-intrinsic-size: auto 260px; }
         
         /* Background Imprint */
         .watermark-bg::before {
@@ -597,20 +807,12 @@ def serve_app():
                 </div>
                 
                 <nav class="flex-grow space-y-1 p-4">
-                    <template v-for="(item, idx) in [
-                        {id: 'dashboard', icon: 'fa-home', label: 'Dashboard'},
-                        {id: 'patients', icon: 'fa-user-injured', label: 'Patients'},
-                        {id: 'visits', icon: 'fa-user-md', label: 'Visits'},
-                        {id: 'inventory', icon: 'fa-leaf', label: 'Inventory'},
-                        {id: 'reports', icon: 'fa-chart-pie', label: 'Reports'}
-                    ]">
-                    <button @click="currentView = item.id" 
-                        :class="currentView===item.id ? 'bg-emerald-700 text-white shadow-lg translate-x-1' : 'text-emerald-100 hover:bg-emerald-800 hover:text-white'" 
+                    <button v-for="item in NAV_ITEMS" :key="item.id" @click="currentView = item.id" 
+                        :class="currentView === item.id ? NAV_ACTIVE_CLASS : NAV_IDLE_CLASS" 
                         class="w-full text-left px-4 py-3 rounded-lg flex items-center gap-3 transition-all duration-200 font-medium group">
-                        <i :class="['fas', item.icon, 'w-5 text-center group-hover:scale-110 transition-transform']"></i> 
+                        <i :class="item.icon"></i> 
                         {{ item.label }}
                     </button>
-                    </template>
                 </nav>
                 
                 <div class="p-4 border-t border-emerald-800/50 bg-emerald-950/30">
@@ -636,7 +838,8 @@ def serve_app():
                         <i class="fas fa-columns text-emerald-600"></i> Dashboard Overview
                     </h2>
                     
-                    <div class="grid grid-cols-1 md:grid-cols-4 gap-6 mb-8">
+                    <!-- Only the four counters are dynamic; skip patching the cards on unrelated root re-renders -->
+                    <div v-memo="[stats.patients, stats.visits, stats.today_visits, stats.remedies]" class="grid grid-cols-1 md:grid-cols-4 gap-6 mb-8">
                         <div class="bg-white p-6 rounded-xl border border-green-100 shadow-sm hover:shadow-md transition duration-300 group">
                             <div class="flex justify-between items-start mb-4">
                                 <div class="bg-lime-50 text-lime-600 p-3 rounded-lg group-hover:bg-lime-600 group-hover:text-white transition">
@@ -707,52 +910,54 @@ def serve_app():
                     </div>
 
                     <!-- New Patient Modal -->
-                    <div v-if="showPatientModal" class="fixed inset-0 bg-emerald-900/50 backdrop-blur-sm flex items-center justify-center z-50 p-4">
-                        <div class="bg-white p-8 rounded-2xl w-full max-w-lg shadow-2xl border border-green-100 animate-slide-up">
-                            <div class="flex justify-between items-center mb-6">
-                                <h3 class="text-xl font-bold text-gray-800">{{ isEditingPatient ? 'Edit Patient' : 'Register New Patient' }}</h3>
-                                <button @click="showPatientModal = false" class="text-gray-400 hover:text-red-500 transition"><i class="fas fa-times text-xl"></i></button>
-                            </div>
-                            
-                            <form @submit.prevent="savePatient" class="space-y-4">
-                                <div>
-                                    <label class="block text-sm font-medium text-gray-700 mb-1">Full Name</label>
-                                    <input v-model="patientForm.name" placeholder="Name" required class="w-full bg-gray-50 border border-gray-200 p-3 rounded-lg focus:outline-none focus:border-green-500 focus:ring-1 focus:ring-green-500 transition">
+                    <teleport to="body">
+                        <div v-show="showPatientModal" class="fixed inset-0 bg-emerald-900/50 backdrop-blur-sm flex items-center justify-center z-50 p-4">
+                            <div class="bg-white p-8 rounded-2xl w-full max-w-lg shadow-2xl border border-green-100 animate-slide-up">
+                                <div class="flex justify-between items-center mb-6">
+                                    <h3 class="text-xl font-bold text-gray-800">{{ isEditingPatient ? 'Edit Patient' : 'Register New Patient' }}</h3>
+                                    <button @click="showPatientModal = false" class="text-gray-400 hover:text-red-500 transition"><i class="fas fa-times text-xl"></i></button>
                                 </div>
-                                <div class="grid grid-cols-2 gap-4">
+                            
+                                <form @submit.prevent="savePatient" class="space-y-4">
                                     <div>
-                                        <label class="block text-sm font-medium text-gray-700 mb-1">Age</label>
-                                        <input v-model="patientForm.age" type="number" placeholder="Years" class="w-full bg-gray-50 border border-gray-200 p-3 rounded-lg focus:outline-none focus:border-green-500 focus:ring-1 focus:ring-green-500 transition">
+                                        <label class="block text-sm font-medium text-gray-700 mb-1">Full Name</label>
+                                        <input v-model="patientForm.name" placeholder="Name" required class="w-full bg-gray-50 border border-gray-200 p-3 rounded-lg focus:outline-none focus:border-green-500 focus:ring-1 focus:ring-green-500 transition">
+                                    </div>
+                                    <div class="grid grid-cols-2 gap-4">
+                                        <div>
+                                            <label class="block text-sm font-medium text-gray-700 mb-1">Age</label>
+                                            <input v-model="patientForm.age" type="number" placeholder="Years" class="w-full bg-gray-50 border border-gray-200 p-3 rounded-lg focus:outline-none focus:border-green-500 focus:ring-1 focus:ring-green-500 transition">
+                                        </div>
+                                        <div>
+                                            <label class="block text-sm font-medium text-gray-700 mb-1">Gender</label>
+                                            <select v-model="patientForm.gender" class="w-full bg-gray-50 border border-gray-200 p-3 rounded-lg focus:outline-none focus:border-green-500 focus:ring-1 focus:ring-green-500 transition">
+                                                <option value="">Select</option>
+                                                <option value="Male">Male</option>
+                                                <option value="Female">Female</option>
+                                                <option value="Third-Gender">Other</option>
+                                            </select>
+                                        </div>
                                     </div>
                                     <div>
-                                        <label class="block text-sm font-medium text-gray-700 mb-1">Gender</label>
-                                        <select v-model="patientForm.gender" class="w-full bg-gray-50 border border-gray-200 p-3 rounded-lg focus:outline-none focus:border-green-500 focus:ring-1 focus:ring-green-500 transition">
-                                            <option value="">Select</option>
-                                            <option value="Male">Male</option>
-                                            <option value="Female">Female</option>
-                                            <option value="Third-Gender">Other</option>
-                                        </select>
+                                        <label class="block text-sm font-medium text-gray-700 mb-1">Phone</label>
+                                        <input v-model="patientForm.phone" placeholder="Contact Number" class="w-full bg-gray-50 border border-gray-200 p-3 rounded-lg focus:outline-none focus:border-green-500 focus:ring-1 focus:ring-green-500 transition">
                                     </div>
-                                </div>
-                                <div>
-                                    <label class="block text-sm font-medium text-gray-700 mb-1">Phone</label>
-                                    <input v-model="patientForm.phone" placeholder="Contact Number" class="w-full bg-gray-50 border border-gray-200 p-3 rounded-lg focus:outline-none focus:border-green-500 focus:ring-1 focus:ring-green-500 transition">
-                                </div>
-                                <div>
-                                    <label class="block text-sm font-medium text-gray-700 mb-1">NID</label>
-                                    <input v-model="patientForm.nid" placeholder="National ID (Optional)" class="w-full bg-gray-50 border border-gray-200 p-3 rounded-lg focus:outline-none focus:border-green-500 focus:ring-1 focus:ring-green-500 transition">
-                                </div>
-                                <div>
-                                    <label class="block text-sm font-medium text-gray-700 mb-1">Address</label>
-                                    <textarea v-model="patientForm.address" placeholder="Residential Address" class="w-full bg-gray-50 border border-gray-200 p-3 rounded-lg focus:outline-none focus:border-green-500 focus:ring-1 focus:ring-green-500 transition h-24"></textarea>
-                                </div>
-                                <div class="flex justify-end gap-3 mt-6 pt-4 border-t border-gray-100">
-                                    <button type="button" @click="showPatientModal = false" class="px-5 py-2 text-gray-500 hover:text-gray-700 font-medium">Cancel</button>
-                                    <button type="submit" class="bg-emerald-600 hover:bg-emerald-700 text-white px-6 py-2 rounded-lg font-bold shadow transition">{{ isEditingPatient ? 'Update Profile' : 'Save Patient' }}</button>
-                                </div>
-                            </form>
+                                    <div>
+                                        <label class="block text-sm font-medium text-gray-700 mb-1">NID</label>
+                                        <input v-model="patientForm.nid" placeholder="National ID (Optional)" class="w-full bg-gray-50 border border-gray-200 p-3 rounded-lg focus:outline-none focus:border-green-500 focus:ring-1 focus:ring-green-500 transition">
+                                    </div>
+                                    <div>
+                                        <label class="block text-sm font-medium text-gray-700 mb-1">Address</label>
+                                        <textarea v-model="patientForm.address" placeholder="Residential Address" class="w-full bg-gray-50 border border-gray-200 p-3 rounded-lg focus:outline-none focus:border-green-500 focus:ring-1 focus:ring-green-500 transition h-24"></textarea>
+                                    </div>
+                                    <div class="flex justify-end gap-3 mt-6 pt-4 border-t border-gray-100">
+                                        <button type="button" @click="showPatientModal = false" class="px-5 py-2 text-gray-500 hover:text-gray-700 font-medium">Cancel</button>
+                                        <button type="submit" class="bg-emerald-600 hover:bg-emerald-700 text-white px-6 py-2 rounded-lg font-bold shadow transition">{{ isEditingPatient ? 'Update Profile' : 'Save Patient' }}</button>
+                                    </div>
+                                </form>
+                            </div>
                         </div>
-                    </div>
+                    </teleport>
 
                     <!-- Patients Table -->
                     <div class="bg-white rounded-xl shadow-lg border border-green-100 overflow-x-auto">
@@ -770,11 +975,11 @@ def serve_app():
                                 <!-- QUICK ADD ROW -->
                                 <tr class="bg-green-50/50">
                                     <td class="p-3">
-                                        <input ref="quickName" v-model="quickPatient.name" @keyup.enter="quickCreatePatient" placeholder="+ Quick Add Name..." class="w-full bg-white border border-green-200 p-2 pl-3 rounded-lg text-sm focus:border-emerald-500 focus:ring-1 focus:ring-emerald-500 outline-none shadow-sm">
+                                        <input ref="quickName" v-model.lazy="quickPatient.name" @keyup.enter="quickCreatePatient" placeholder="+ Quick Add Name..." class="w-full bg-white border border-green-200 p-2 pl-3 rounded-lg text-sm focus:border-emerald-500 focus:ring-1 focus:ring-emerald-500 outline-none shadow-sm">
                                     </td>
                                     <td class="p-2">
                                         <div class="flex gap-2">
-                                            <input v-model="quickPatient.age" @keyup.enter="quickCreatePatient" type="number" placeholder="Age" class="w-16 bg-white border border-green-200 p-2 rounded-lg text-sm text-center outline-none">
+                                            <input v-model.lazy="quickPatient.age" @keyup.enter="quickCreatePatient" type="number" placeholder="Age" class="w-16 bg-white border border-green-200 p-2 rounded-lg text-sm text-center outline-none">
                                             <select v-model="quickPatient.gender" class="flex-1 bg-white border border-green-200 p-2 rounded-lg text-sm outline-none">
                                                 <option value="" disabled selected>Gen</option>
                                                 <option value="Male">M</option>
@@ -784,10 +989,10 @@ def serve_app():
                                         </div>
                                     </td>
                                     <td class="p-2">
-                                        <input v-model="quickPatient.phone" @keyup.enter="quickCreatePatient" placeholder="Phone" class="w-full bg-white border border-green-200 p-2 rounded-lg text-sm outline-none">
+                                        <input v-model.lazy="quickPatient.phone" @keyup.enter="quickCreatePatient" placeholder="Phone" class="w-full bg-white border border-green-200 p-2 rounded-lg text-sm outline-none">
                                     </td>
                                     <td class="p-2 flex gap-2">
-                                        <input v-model="quickPatient.nid" @keyup.enter="quickCreatePatient" placeholder="NID" class="flex-1 bg-white border border-green-200 p-2 rounded-lg text-sm outline-none">
+                                        <input v-model.lazy="quickPatient.nid" @keyup.enter="quickCreatePatient" placeholder="NID" class="flex-1 bg-white border border-green-200 p-2 rounded-lg text-sm outline-none">
                                         <button @click="quickCreatePatient" class="bg-emerald-600 hover:bg-emerald-700 text-white px-4 rounded-lg font-bold shadow-sm transition">
                                             <i class="fas fa-plus"></i>
                                         </button>
@@ -818,88 +1023,12 @@ def serve_app():
                             </tbody>
                         </table>
                     </div>
+                    <!-- Sentinel: fetches the next page of patients as it scrolls into view -->
+                    <div v-if="cursors.patients !== null" v-on-visible="() => loadMore('patients')" class="h-8"></div>
                 </div>
 
-                <!-- INVENTORY VIEW -->
-                <div v-if="currentView === 'inventory'" class="max-w-7xl mx-auto">
-                    <div class="flex justify-between items-center mb-6">
-                        <h2 class="text-3xl font-bold text-emerald-900">Medicine Inventory</h2>
-                        <button v-if="['admin','doctor'].includes(userRole)" @click="openRemedyModal()" class="bg-emerald-600 hover:bg-emerald-700 text-white px-6 py-2 rounded-lg font-bold shadow-md transition flex items-center gap-2">
-                            <i class="fas fa-leaf"></i> Add Remedy
-                        </button>
-                    </div>
-
-                    <!-- Add/Edit Remedy Modal -->
-                    <div v-if="showRemedyModal" class="fixed inset-0 bg-emerald-900/50 backdrop-blur-sm flex items-center justify-center z-50 p-4">
-                        <div class="bg-white p-8 rounded-2xl w-full max-w-lg shadow-2xl border border-green-100">
-                            <h3 class="text-xl font-bold mb-6 text-gray-800 border-b border-gray-100 pb-2">
-                                {{ isEditingRemedy ? 'Edit Remedy' : 'Add To Inventory' }}
-                            </h3>
-                            <form @submit.prevent="saveRemedy" class="space-y-4">
-                                <div>
-                                    <label class="block text-sm font-medium text-gray-700 mb-1">Medicine Name</label>
-                                    <input v-model="remedyForm.name" placeholder="E.g. Arnica Mont" required class="w-full bg-gray-50 border border-gray-200 p-3 rounded-lg focus:outline-none focus:border-green-500 focus:ring-1 focus:ring-green-500 transition">
-                                </div>
-                                <div class="grid grid-cols-2 gap-4">
-                                    <div>
-                                        <label class="block text-sm font-medium text-gray-700 mb-1">Potency</label>
-                                        <select v-model="remedyForm.potency" class="w-full bg-gray-50 border border-gray-200 p-3 rounded-lg focus:outline-none focus:border-green-500 focus:ring-1 focus:ring-green-500 transition">
-                                            <option value="30">30</option>
-                                            <option value="200">200</option>
-                                            <option value="1X">1X</option>
-                                            <option value="6X">6X</option>
-                                            <option value="12X">12X</option>
-                                            <option value="60">60</option>
-                                        </select>
-                                    </div>
-                                    <div>
-                                        <label class="block text-sm font-medium text-gray-700 mb-1">Stock Qty</label>
-                                        <input v-model="remedyForm.stock_quantity" type="number" placeholder="0" class="w-full bg-gray-50 border border-gray-200 p-3 rounded-lg focus:outline-none focus:border-green-500 focus:ring-1 focus:ring-green-500 transition">
-                                    </div>
-                                </div>
-                                <div>
-                                    <label class="block text-sm font-medium text-gray-700 mb-1">Unit Price (BDT)</label>
-                                    <input v-model="remedyForm.current_unit_price" type="number" step="0.01" class="w-full bg-gray-50 border border-gray-200 p-3 rounded-lg focus:outline-none focus:border-green-500 focus:ring-1 focus:ring-green-500 transition">
-                                </div>
-                                <div>
-                                    <label class="block text-sm font-medium text-gray-700 mb-1">Description / Indications</label>
-                                    <textarea v-model="remedyForm.description" placeholder="Usage instructions..." class="w-full bg-gray-50 border border-gray-200 p-3 rounded-lg focus:outline-none focus:border-green-500 focus:ring-1 focus:ring-green-500 transition h-24"></textarea>
-                                </div>
-                                <div class="flex justify-end gap-3 mt-6 pt-4 border-t border-gray-100">
-                                    <button type="button" @click="showRemedyModal = false" class="px-5 py-2 text-gray-500 hover:text-gray-700 font-medium">Cancel</button>
-                                    <button type="submit" class="bg-emerald-600 hover:bg-emerald-700 text-white px-6 py-2 rounded-lg font-bold shadow transition">{{ isEditingRemedy ? 'Update' : 'Add Item' }}</button>
-                                </div>
-                            </form>
-                        </div>
-                    </div>
-
-                    <div class="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6">
-                        <div v-for="r in remedies" :key="r.id" class="bg-white p-5 rounded-xl border border-green-100 shadow-sm hover:shadow-lg hover:border-green-300 transition relative group flex flex-col h-full">
-                            <button v-if="['admin','doctor'].includes(userRole)" @click="openRemedyModal(r)" class="absolute top-3 right-3 bg-gray-100 text-gray-500 hover:bg-emerald-600 hover:text-white p-2 w-8 h-8 flex items-center justify-center rounded-full transition opacity-0 group-hover:opacity-100 shadow-sm z-10">
-                                <i class="fas fa-edit text-xs"></i>
-                            </button>
-                            
-                            <div class="flex items-center gap-3 mb-3">
-                                <div class="w-10 h-10 rounded-full bg-green-50 text-green-600 flex items-center justify-center border border-green-100">
-                                    <i class="fas fa-flask"></i>
-                                </div>
-                                <div>
-                                    <h4 class="font-bold text-lg text-gray-800 leading-tight">{{ r.name }}</h4>
-                                    <span class="bg-emerald-100 text-emerald-800 px-2 py-0.5 rounded text-[10px] font-bold uppercase tracking-wider">{{ r.potency }}</span>
-                                </div>
-                            </div>
-                            
-                            <p class="text-sm text-gray-500 mb-4 h-12 overflow-hidden line-clamp-2 leading-relaxed">{{ r.description }}</p>
-                            
-                            <div class="mt-auto flex justify-between items-center text-sm pt-4 border-t border-gray-50">
-                                <span :class="r.stock_quantity < 10 ? 'text-red-500 font-bold bg-red-50 px-2 py-1 rounded' : 'text-gray-500 bg-gray-50 px-2 py-1 rounded'">
-                                    Stock: {{ r.stock_quantity }}
-                                </span>
-                                <span class="font-bold text-emerald-700 text-base">BDT {{ r.current_unit_price }}</span>
-                            </div>
-                        </div>
-                    </div>
-                </div>
+                <!-- INVENTORY VIEW (static/views/Inventory.js, loaded on first visit) -->
+                <inventory-view v-if="currentView === 'inventory'" :remedies="remedies" :has-more="cursors.remedies !== null" :user-role="userRole" :api="api" @saved="onRemedySaved" @load-more="loadMore('remedies')"></inventory-view>
 
                 <!-- VISITS VIEW -->
                 <div v-if="currentView === 'visits'" class="max-w-7xl mx-auto">
@@ -911,123 +1040,126 @@ def serve_app():
                     </div>
 
                     <!-- New Visit Modal -->
-                    <div v-if="showVisitModal" class="fixed inset-0 bg-emerald-900/50 backdrop-blur-sm flex items-center justify-center z-50 p-4">
-                        <div class="bg-white p-8 rounded-2xl w-full max-w-4xl border border-green-100 max-h-[90vh] overflow-y-auto shadow-2xl">
-                            <h3 class="text-xl font-bold mb-6 text-gray-800 border-b border-gray-100 pb-2">Record Visit & Billing</h3>
-                            <form @submit.prevent="createVisit" class="grid grid-cols-1 lg:grid-cols-3 gap-8">
-                                <!-- LEFT COLUMN: MEDICAL -->
-                                <div class="lg:col-span-2 space-y-4">
-                                    <!-- Patient Selector -->
-                                    <div class="bg-gray-50 p-4 rounded-xl border border-gray-200">
-                                        <div class="flex justify-between items-center mb-3">
-                                            <label class="block text-sm font-bold text-gray-700">Patient Details</label>
-                                            <label class="flex items-center gap-2 cursor-pointer bg-white px-3 py-1 rounded-full border border-gray-200 shadow-sm hover:border-blue-400 transition">
-                                                <input type="checkbox" v-model="isNewPatientForVisit" class="form-checkbox h-4 w-4 text-emerald-600 rounded">
-                                                <span class="text-xs text-emerald-700 font-bold">New Patient?</span>
-                                            </label>
-                                        </div>
+                    <teleport to="body">
+                        <div v-show="showVisitModal" class="fixed inset-0 bg-emerald-900/50 backdrop-blur-sm flex items-center justify-center z-50 p-4">
+                            <div class="bg-white p-8 rounded-2xl w-full max-w-4xl border border-green-100 max-h-[90vh] overflow-y-auto shadow-2xl">
+                                <h3 class="text-xl font-bold mb-6 text-gray-800 border-b border-gray-100 pb-2">Record Visit & Billing</h3>
+                                <form @submit.prevent="createVisit" class="grid grid-cols-1 lg:grid-cols-3 gap-8">
+                                    <!-- LEFT COLUMN: MEDICAL -->
+                                    <div class="lg:col-span-2 space-y-4">
+                                        <!-- Patient Selector -->
+                                        <div class="bg-gray-50 p-4 rounded-xl border border-gray-200">
+                                            <div class="flex justify-between items-center mb-3">
+                                                <label class="block text-sm font-bold text-gray-700">Patient Details</label>
+                                                <label class="flex items-center gap-2 cursor-pointer bg-white px-3 py-1 rounded-full border border-gray-200 shadow-sm hover:border-blue-400 transition">
+                                                    <input type="checkbox" v-model="isNewPatientForVisit" class="form-checkbox h-4 w-4 text-emerald-600 rounded">
+                                                    <span class="text-xs text-emerald-700 font-bold">New Patient?</span>
+                                                </label>
+                                            </div>
                                         
-                                        <div v-if="!isNewPatientForVisit">
-                                            <select v-model="visitForm.patient_id" class="w-full bg-white border border-gray-300 p-3 rounded-lg focus:ring-2 focus:ring-emerald-500 focus:border-emerald-500 transition">
-                                                <option value="">-- Select Existing Patient --</option>
-                                                <option v-for="p in patients" :value="p.id">{{ p.name }} ({{ p.phone }})</option>
-                                            </select>
-                                        </div>
+                                            <div v-if="!isNewPatientForVisit" class="relative">
+                                                <input v-model="patientSearch" @input="searchPatients" @blur="patientHits = []" placeholder="Search existing patient by name or phone..." class="w-full bg-white border border-gray-300 p-3 rounded-lg focus:ring-2 focus:ring-emerald-500 focus:border-emerald-500 transition">
+                                                <ul v-if="patientHits.length" class="absolute z-10 left-0 right-0 mt-1 bg-white border border-gray-200 rounded-lg shadow-lg max-h-60 overflow-y-auto">
+                                                    <li v-for="p in patientHits" :key="p.id" @mousedown.prevent="pickPatient(p)" class="px-3 py-2 text-sm hover:bg-emerald-50 cursor-pointer">{{ p.label }}</li>
+                                                </ul>
+                                            </div>
                                         
-                                        <div v-else class="space-y-3 animate-fade-in">
-                                            <input v-model="visitNewPatient.name" placeholder="Full Name" class="w-full bg-white border border-gray-300 p-2 rounded-lg focus:ring-2 focus:ring-emerald-500">
-                                            <div class="flex gap-3">
-                                                <input v-model="visitNewPatient.phone" placeholder="Phone" class="w-1/2 bg-white border border-gray-300 p-2 rounded-lg focus:ring-2 focus:ring-emerald-500">
-                                                <input v-model="visitNewPatient.age" type="number" placeholder="Age" class="w-1/4 bg-white border border-gray-300 p-2 rounded-lg focus:ring-2 focus:ring-emerald-500">
-                                                <select v-model="visitNewPatient.gender" class="w-1/4 bg-white border border-gray-300 p-2 rounded-lg focus:ring-2 focus:ring-emerald-500">
-                                                    <option value="">Sex</option>
-                                                    <option value="Male">M</option>
-                                                    <option value="Female">F</option>
-                                                </select>
+                                            <div v-else class="space-y-3 animate-fade-in">
+                                                <input v-model="visitNewPatient.name" placeholder="Full Name" class="w-full bg-white border border-gray-300 p-2 rounded-lg focus:ring-2 focus:ring-emerald-500">
+                                                <div class="flex gap-3">
+                                                    <input v-model="visitNewPatient.phone" placeholder="Phone" class="w-1/2 bg-white border border-gray-300 p-2 rounded-lg focus:ring-2 focus:ring-emerald-500">
+                                                    <input v-model="visitNewPatient.age" type="number" placeholder="Age" class="w-1/4 bg-white border border-gray-300 p-2 rounded-lg focus:ring-2 focus:ring-emerald-500">
+                                                    <select v-model="visitNewPatient.gender" class="w-1/4 bg-white border border-gray-300 p-2 rounded-lg focus:ring-2 focus:ring-emerald-500">
+                                                        <option value="">Sex</option>
+                                                        <option value="Male">M</option>
+                                                        <option value="Female">F</option>
+                                                    </select>
+                                                </div>
                                             </div>
                                         </div>
-                                    </div>
                                     
-                                    <!-- Diagnosis Inputs -->
-                                    <div class="grid grid-cols-2 gap-4">
-                                        <div>
-                                            <label class="block text-xs font-bold text-gray-500 mb-1 uppercase">Chief Complaint</label>
-                                            <textarea v-model="visitForm.chief_complaint" required class="w-full bg-white border border-gray-200 p-3 rounded-xl focus:outline-none focus:ring-2 focus:ring-emerald-500 h-32 resize-none"></textarea>
+                                        <!-- Diagnosis Inputs -->
+                                        <div class="grid grid-cols-2 gap-4">
+                                            <div>
+                                                <label class="block text-xs font-bold text-gray-500 mb-1 uppercase">Chief Complaint</label>
+                                                <textarea v-model="visitForm.chief_complaint" required class="w-full bg-white border border-gray-200 p-3 rounded-xl focus:outline-none focus:ring-2 focus:ring-emerald-500 h-32 resize-none"></textarea>
+                                            </div>
+                                            <div>
+                                                <label class="block text-xs font-bold text-gray-500 mb-1 uppercase">Diagnosis</label>
+                                                <textarea v-model="visitForm.diagnosis" class="w-full bg-white border border-gray-200 p-3 rounded-xl focus:outline-none focus:ring-2 focus:ring-emerald-500 h-32 resize-none"></textarea>
+                                            </div>
                                         </div>
                                         <div>
-                                            <label class="block text-xs font-bold text-gray-500 mb-1 uppercase">Diagnosis</label>
-                                            <textarea v-model="visitForm.diagnosis" class="w-full bg-white border border-gray-200 p-3 rounded-xl focus:outline-none focus:ring-2 focus:ring-emerald-500 h-32 resize-none"></textarea>
+                                            <label class="block text-xs font-bold text-gray-500 mb-1 uppercase">Notes / Prescription</label>
+                                            <textarea v-model="visitForm.notes" class="w-full bg-white border border-gray-200 p-3 rounded-xl focus:outline-none focus:ring-2 focus:ring-emerald-500 h-20 resize-none"></textarea>
                                         </div>
                                     </div>
-                                    <div>
-                                        <label class="block text-xs font-bold text-gray-500 mb-1 uppercase">Notes / Prescription</label>
-                                        <textarea v-model="visitForm.notes" class="w-full bg-white border border-gray-200 p-3 rounded-xl focus:outline-none focus:ring-2 focus:ring-emerald-500 h-20 resize-none"></textarea>
-                                    </div>
-                                </div>
 
-                                <!-- RIGHT COLUMN: BILLING -->
-                                <div class="bg-gray-50 p-6 rounded-xl border border-gray-200 flex flex-col h-full">
-                                    <h4 class="font-bold text-emerald-800 mb-4 flex items-center gap-2 border-b border-gray-200 pb-2">
-                                        <i class="fas fa-file-invoice-dollar"></i> Billing
-                                    </h4>
+                                    <!-- RIGHT COLUMN: BILLING -->
+                                    <div class="bg-gray-50 p-6 rounded-xl border border-gray-200 flex flex-col h-full">
+                                        <h4 class="font-bold text-emerald-800 mb-4 flex items-center gap-2 border-b border-gray-200 pb-2">
+                                            <i class="fas fa-file-invoice-dollar"></i> Billing
+                                        </h4>
                                     
-                                    <div class="space-y-4 flex-grow">
-                                        <!-- Doctor Fee -->
-                                        <div>
-                                            <label class="block text-xs font-bold text-gray-500 mb-1">Consultation Fee (BDT)</label>
-                                            <input v-model="visitForm.consultation_fee" type="number" class="w-full bg-white border border-gray-300 p-2 rounded-lg font-mono text-right">
-                                        </div>
-
-                                        <!-- Medicines Picker -->
-                                        <div>
-                                            <label class="block text-xs font-bold text-gray-500 mb-1">Prescribe Medicine</label>
-                                            <div class="flex gap-2">
-                                                <select v-model="selectedRemedyId" class="flex-grow bg-white border border-gray-300 p-2 rounded-lg text-sm">
-                                                    <option value="">Select Remedy...</option>
-                                                    <option v-for="r in remedies" :value="r.id">{{ r.name }} {{ r.potency }} ({{ r.stock_quantity }})</option>
-                                                </select>
-                                                <button type="button" @click="addMedicine" class="bg-emerald-600 text-white px-3 rounded-lg hover:bg-emerald-700 transition">
-                                                    <i class="fas fa-plus"></i>
-                                                </button>
+                                        <div class="space-y-4 flex-grow">
+                                            <!-- Doctor Fee -->
+                                            <div>
+                                                <label class="block text-xs font-bold text-gray-500 mb-1">Consultation Fee (BDT)</label>
+                                                <input v-model="visitForm.consultation_fee" type="number" class="w-full bg-white border border-gray-300 p-2 rounded-lg font-mono text-right">
                                             </div>
-                                        </div>
 
-                                        <!-- Selected Medicines List -->
-                                        <div v-if="visitForm.medicines.length > 0" class="bg-white rounded-lg border border-gray-200 p-2 max-h-32 overflow-y-auto custom-scrollbar">
-                                            <div v-for="(m, idx) in visitForm.medicines" class="flex justify-between items-center text-sm p-2 border-b border-gray-100 last:border-0 hover:bg-gray-50">
-                                                <div class="flex items-center gap-2">
-                                                    <i class="fas fa-pills text-emerald-500 text-xs"></i>
-                                                    <span class="font-medium text-gray-700">Item #{{ m.remedy_id }}</span>
-                                                    <span class="text-xs bg-gray-100 px-2 rounded-full">x{{ m.quantity }}</span>
+                                            <!-- Medicines Picker -->
+                                            <div>
+                                                <label class="block text-xs font-bold text-gray-500 mb-1">Prescribe Medicine</label>
+                                                <div class="flex gap-2 relative">
+                                                    <input v-model="remedySearch" @input="searchRemedies" @focus="remedySearchOpen = true" @blur="remedySearchOpen = false" placeholder="Search remedy..." class="flex-grow bg-white border border-gray-300 p-2 rounded-lg text-sm">
+                                                    <ul v-if="remedySearchOpen && remedyHits.length" class="absolute z-10 left-0 right-0 top-full mt-1 bg-white border border-gray-200 rounded-lg shadow-lg max-h-60 overflow-y-auto">
+                                                        <li v-for="r in remedyHits" :key="r.id" @mousedown.prevent="pickRemedy(r)" class="px-3 py-2 text-sm hover:bg-emerald-50 cursor-pointer">{{ r.label }}</li>
+                                                    </ul>
+                                                    <button type="button" @click="addMedicine" class="bg-emerald-600 text-white px-3 rounded-lg hover:bg-emerald-700 transition">
+                                                        <i class="fas fa-plus"></i>
+                                                    </button>
                                                 </div>
-                                                <button type="button" @click="visitForm.medicines.splice(idx, 1)" class="text-gray-400 hover:text-red-500 transition"><i class="fas fa-times"></i></button>
                                             </div>
-                                        </div>
 
-                                        <!-- Payment & Totals -->
-                                        <div class="border-t-2 border-dashed border-gray-300 pt-4 mt-auto">
-                                            <div class="flex justify-between items-center mb-2">
-                                                <span class="text-sm text-gray-600">Total Bill</span>
-                                                <span class="text-lg font-bold text-emerald-700">BDT {{ calculateTotal }}</span>
+                                            <!-- Selected Medicines List -->
+                                            <div v-if="visitMedicines.length > 0" class="bg-white rounded-lg border border-gray-200 p-2 max-h-32 overflow-y-auto custom-scrollbar">
+                                                <div v-for="m in visitMedicines" :key="m.remedy_id" v-memo="[m.quantity]" class="flex justify-between items-center text-sm p-2 border-b border-gray-100 last:border-0 hover:bg-gray-50">
+                                                    <div class="flex items-center gap-2">
+                                                        <i class="fas fa-pills text-emerald-500 text-xs"></i>
+                                                        <span class="font-medium text-gray-700">Item #{{ m.remedy_id }}</span>
+                                                        <span class="text-xs bg-gray-100 px-2 rounded-full">x{{ m.quantity }}</span>
+                                                    </div>
+                                                    <button type="button" @click="removeMedicine(m.remedy_id)" class="text-gray-400 hover:text-red-500 transition"><i class="fas fa-times"></i></button>
+                                                </div>
                                             </div>
+
+                                            <!-- Payment & Totals -->
+                                            <div class="border-t-2 border-dashed border-gray-300 pt-4 mt-auto">
+                                                <div class="flex justify-between items-center mb-2">
+                                                    <span class="text-sm text-gray-600">Total Bill</span>
+                                                    <span class="text-lg font-bold text-emerald-700">BDT {{ calculateTotal }}</span>
+                                                </div>
                                             
-                                            <label class="block text-xs font-bold text-gray-500 mb-1">Amount Paid Now</label>
-                                            <input v-model="visitForm.amount_paid" type="number" class="w-full bg-white border-2 border-emerald-100 p-2 rounded-lg font-mono text-right focus:border-emerald-500 focus:outline-none transition">
+                                                <label class="block text-xs font-bold text-gray-500 mb-1">Amount Paid Now</label>
+                                                <input v-model="visitForm.amount_paid" type="number" class="w-full bg-white border-2 border-emerald-100 p-2 rounded-lg font-mono text-right focus:border-emerald-500 focus:outline-none transition">
+                                            </div>
                                         </div>
-                                    </div>
                                     
-                                    <div class="flex gap-3 mt-6">
-                                        <button type="button" @click="showVisitModal = false" class="px-4 py-2 text-gray-500 hover:text-gray-700 font-medium">Cancel</button>
-                                        <button type="submit" class="flex-grow bg-emerald-600 hover:bg-emerald-700 text-white px-4 py-2 rounded-lg font-bold shadow-md transition">Save & Print</button>
+                                        <div class="flex gap-3 mt-6">
+                                            <button type="button" @click="showVisitModal = false" class="px-4 py-2 text-gray-500 hover:text-gray-700 font-medium">Cancel</button>
+                                            <button type="submit" class="flex-grow bg-emerald-600 hover:bg-emerald-700 text-white px-4 py-2 rounded-lg font-bold shadow-md transition">Save & Print</button>
+                                        </div>
                                     </div>
-                                </div>
-                            </form>
+                                </form>
+                            </div>
                         </div>
-                    </div>
+                    </teleport>
 
                     <!-- Visits List -->
                     <div class="space-y-4">
-                        <div v-for="v in visits" :key="v.id" class="bg-white p-0 rounded-xl border border-green-100 shadow-sm relative overflow-hidden group hover:shadow-md transition">
+                        <!-- Rows are frozen and swapped whole on change, so identity covers every field -->
+                        <div v-for="v in visits" :key="v.id" v-memo="[v, userRole]" class="offscreen-skip bg-white p-0 rounded-xl border border-green-100 shadow-sm relative overflow-hidden group hover:shadow-md transition">
                             <!-- Header Bar -->
                             <div class="bg-gray-50 p-4 border-b border-gray-100 flex justify-between items-center">
                                 <div>
@@ -1095,38 +1227,42 @@ def serve_app():
                             </div>
                         </div>
                     </div>
+                    <!-- Sentinel: fetches the next page of visits as it scrolls into view -->
+                    <div v-if="cursors.visits !== null" v-on-visible="() => loadMore('visits')" class="h-8"></div>
                     <!-- Admin Payment Modal -->
-                    <div v-if="showPaymentModal" class="fixed inset-0 bg-emerald-900/50 backdrop-blur-sm flex items-center justify-center z-50 p-4">
-                        <div class="bg-white p-8 rounded-2xl w-full max-w-sm border border-green-100 shadow-2xl animate-fade-in">
-                            <h3 class="text-xl font-bold mb-6 text-emerald-900 border-b border-green-100 pb-2">Edit Payment / Bill</h3>
-                            <form @submit.prevent="savePayment" class="space-y-4">
-                                <div>
-                                    <label class="block text-sm font-medium text-gray-700 mb-1">Consultation Fee</label>
-                                    <input v-model="paymentForm.consultation_fee" type="number" class="w-full bg-gray-50 border border-green-200 p-3 rounded-lg font-mono text-gray-800 outline-none focus:ring-1 focus:ring-emerald-500">
-                                </div>
-                                <div>
-                                    <label class="block text-sm font-medium text-gray-700 mb-1">Medicine Bill (Override)</label>
-                                    <input v-model="paymentForm.medicine_bill" type="number" class="w-full bg-gray-50 border border-green-200 p-3 rounded-lg font-mono text-gray-800 outline-none focus:ring-1 focus:ring-emerald-500">
-                                </div>
-                                <div>
-                                    <label class="block text-sm font-medium text-gray-700 mb-1">Total Paid</label>
-                                    <input v-model="paymentForm.amount_paid" type="number" class="w-full bg-gray-50 border border-green-200 p-3 rounded-lg font-mono text-gray-800 outline-none focus:ring-1 focus:ring-emerald-500">
-                                </div>
+                    <teleport to="body">
+                        <div v-show="showPaymentModal" class="fixed inset-0 bg-emerald-900/50 backdrop-blur-sm flex items-center justify-center z-50 p-4">
+                            <div class="bg-white p-8 rounded-2xl w-full max-w-sm border border-green-100 shadow-2xl animate-fade-in">
+                                <h3 class="text-xl font-bold mb-6 text-emerald-900 border-b border-green-100 pb-2">Edit Payment / Bill</h3>
+                                <form @submit.prevent="savePayment" class="space-y-4">
+                                    <div>
+                                        <label class="block text-sm font-medium text-gray-700 mb-1">Consultation Fee</label>
+                                        <input v-model="paymentForm.consultation_fee" type="number" class="w-full bg-gray-50 border border-green-200 p-3 rounded-lg font-mono text-gray-800 outline-none focus:ring-1 focus:ring-emerald-500">
+                                    </div>
+                                    <div>
+                                        <label class="block text-sm font-medium text-gray-700 mb-1">Medicine Bill (Override)</label>
+                                        <input v-model="paymentForm.medicine_bill" type="number" class="w-full bg-gray-50 border border-green-200 p-3 rounded-lg font-mono text-gray-800 outline-none focus:ring-1 focus:ring-emerald-500">
+                                    </div>
+                                    <div>
+                                        <label class="block text-sm font-medium text-gray-700 mb-1">Total Paid</label>
+                                        <input v-model="paymentForm.amount_paid" type="number" class="w-full bg-gray-50 border border-green-200 p-3 rounded-lg font-mono text-gray-800 outline-none focus:ring-1 focus:ring-emerald-500">
+                                    </div>
                                 
-                                <div class="p-4 bg-emerald-50 rounded-xl text-center border border-emerald-100">
-                                    <p class="text-xs text-emerald-600 font-bold uppercase tracking-wider">New Due Amount</p>
-                                    <p class="text-2xl font-bold text-red-500 mt-1">
-                                        {{ paymentDue }}
-                                    </p>
-                                </div>
+                                    <div class="p-4 bg-emerald-50 rounded-xl text-center border border-emerald-100">
+                                        <p class="text-xs text-emerald-600 font-bold uppercase tracking-wider">New Due Amount</p>
+                                        <p class="text-2xl font-bold text-red-500 mt-1">
+                                            {{ paymentDue }}
+                                        </p>
+                                    </div>
 
-                                <div class="flex justify-end gap-3 mt-6">
-                                    <button type="button" @click="showPaymentModal = false" class="px-5 py-2 text-gray-500 hover:text-gray-700 font-medium">Cancel</button>
-                                    <button type="submit" class="bg-emerald-600 hover:bg-emerald-700 text-white px-6 py-2 rounded-lg font-bold shadow-md transition">Update</button>
-                                </div>
-                            </form>
+                                    <div class="flex justify-end gap-3 mt-6">
+                                        <button type="button" @click="showPaymentModal = false" class="px-5 py-2 text-gray-500 hover:text-gray-700 font-medium">Cancel</button>
+                                        <button type="submit" class="bg-emerald-600 hover:bg-emerald-700 text-white px-6 py-2 rounded-lg font-bold shadow-md transition">Update</button>
+                                    </div>
+                                </form>
+                            </div>
                         </div>
-                    </div>
+                    </teleport>
 
                 </div>
 
@@ -1167,9 +1303,74 @@ def serve_app():
     </div>
 
     <script>
-        const { createApp } = Vue;
-
-        createApp({
+        const { createApp, defineAsyncComponent, markRaw } = Vue;
+
+        // Sidebar navigation: built once instead of re-creating the array literal on every render
+        const NAV_ICON_CLASS = 'fas w-5 text-center group-hover:scale-110 transition-transform';
+        const NAV_ITEMS = Object.freeze([
+            { id: 'dashboard', icon: `${NAV_ICON_CLASS} fa-home`, label: 'Dashboard' },
+            { id: 'patients', icon: `${NAV_ICON_CLASS} fa-user-injured`, label: 'Patients' },
+            { id: 'visits', icon: `${NAV_ICON_CLASS} fa-user-md`, label: 'Visits' },
+            { id: 'inventory', icon: `${NAV_ICON_CLASS} fa-leaf`, label: 'Inventory' },
+            { id: 'reports', icon: `${NAV_ICON_CLASS} fa-chart-pie`, label: 'Reports' }
+        ].map(Object.freeze));
+        const NAV_ACTIVE_CLASS = 'bg-emerald-700 text-white shadow-lg translate-x-1';
+        const NAV_IDLE_CLASS = 'text-emerald-100 hover:bg-emerald-800 hover:text-white';
+
+        // Lists load one keyset page at a time; the cursor is the last row of the previous page as
+        // fetched, so a later edit to that row (a remedy rename) can't shift where the next page starts
+        const PAGE_SIZE = 40;
+        const nextCursor = page => page.length === PAGE_SIZE ? page[page.length - 1] : null;
+        const cursorQuery = (kind, row) => kind === 'remedies'
+            ? `after=${row.id}&after_name=${encodeURIComponent(row.name)}`
+            : `after=${row.id}`; // Patients and visits page on immutable created/visit dates
+        const loadingMore = new Set();
+
+        // Dashboard counters: shown from the last fetch, revalidated on entry once older than this
+        const STATS_MAX_AGE = 10000; // ms
+        let statsFetchedAt = 0;
+
+        // Server lists are display-only and replaced wholesale, never edited in place:
+        // raw + frozen arrays skip Vue's per-row Proxy wrapping entirely
+        // (a shared in-flight response can reach here twice, and a frozen array can't be marked again)
+        // An error reply ({detail: ...}) becomes an empty list rather than a throw in markRaw
+        const EMPTY = Object.freeze([]);
+        const frozenList = rows => !Array.isArray(rows) ? EMPTY
+            : Object.isFrozen(rows) ? rows : Object.freeze(markRaw(rows));
+
+        // "token url" -> pending GET; concurrent identical reads share one request and one JSON parse.
+        // The token is part of the key so a read started before logout never answers the next user
+        const inflight = new Map();
+
+        // Visit modal pickers: server-side search with a trailing debounce + small LRU of recent queries.
+        // Entries hold the request promise, so a repeat query still in flight shares its fetch
+        const SEARCH_DELAY = 150;
+        const SEARCH_LIMITS = { patients: 20, remedies: 50 };
+        const SEARCH_CACHE_SIZE = 10;
+        const SEARCH_CACHE_TTL = 30000; // ms; stock levels on remedy hits go stale
+        // Dropdown text is built once per fetched hit, not on every render of the visit modal
+        const SEARCH_LABELS = {
+            patients: p => `${p.name} (${p.phone ?? ''})`,
+            remedies: r => `${r.name} ${r.potency ?? ''} (${r.stock_quantity})`
+        };
+        const searchCache = new Map();
+        const searchTimers = {};
+
+        // toLocale*String() builds a fresh formatter per call; these are built once, same locale and output
+        const DATE_FMT = new Intl.DateTimeFormat();
+        const TIME_FMT = new Intl.DateTimeFormat(undefined, { hour: 'numeric', minute: 'numeric', second: 'numeric' });
+
+        // remedy_id -> entry of visitMedicines, so re-adding a medicine bumps its quantity in O(1)
+        const visitMedicineById = new Map();
+
+        const app = createApp({
+            components: {
+                InventoryView: defineAsyncComponent(() => import('/static/views/Inventory.js'))
+            },
+            setup() {
+                // Non-reactive constants exposed to the template
+                return { NAV_ITEMS, NAV_ACTIVE_CLASS, NAV_IDLE_CLASS };
+            },
             data() {
                 return {
                     token: localStorage.getItem('token') || null,
@@ -1182,6 +1383,7 @@ def serve_app():
                     patients: [],
                     remedies: [],
                     visits: [],
+                    cursors: { patients: null, remedies: null, visits: null },
                     reports: { history: [], revenue: [] },
                     
                     showPatientModal: false,
@@ -1189,12 +1391,13 @@ def serve_app():
                     patientForm: { id: null, name: '', nid: '', phone: '', age: '', gender: '', address: '' },
                     quickPatient: { name: '', nid: '', phone: '', age: '', gender: '' },
                     
-                    showRemedyModal: false,
-                    isEditingRemedy: false,
-                    remedyForm: { id: null, name: '', potency: '30', description: '', current_unit_price: '', stock_quantity: 0 },
-                    
                     showVisitModal: false,
-                    selectedRemedyId: '',
+                    selectedRemedy: null,
+                    remedySearch: '',
+                    remedyHits: [],
+                    remedySearchOpen: false,
+                    patientSearch: '',
+                    patientHits: [],
                     isNewPatientForVisit: false,
                     visitNewPatient: { name: '', phone: '', age: '', gender: '' },
                     visitForm: { 
@@ -1203,9 +1406,10 @@ def serve_app():
                         diagnosis: '', 
                         notes: '', 
                         consultation_fee: 500,
-                        medicines: [],
                         amount_paid: 0
                     },
+                    // Kept apart from visitForm so adding a medicine doesn't touch the form object
+                    visitMedicines: [],
                     
                     showPaymentModal: false,
                     paymentForm: { visit_id: null, consultation_fee: 0, medicine_bill: 0, amount_paid: 0 }
@@ -1216,6 +1420,11 @@ def serve_app():
                     await this.loadAll();
                 }
             },
+            watch: {
+                currentView(view) {
+                    if (view === 'dashboard') this.loadStats(STATS_MAX_AGE);
+                }
+            },
             computed: {
                 paymentDue() {
                     const c = parseFloat(this.paymentForm.consultation_fee || 0);
@@ -1225,27 +1434,88 @@ def serve_app():
                 },
                 calculateTotal() {
                     let fee = parseFloat(this.visitForm.consultation_fee || 0);
-                    let meds = this.visitForm.medicines.reduce((sum, item) => {
-                         let r = this.remedies.find(r => r.id == item.remedy_id);
-                         let price = r ? parseFloat(r.current_unit_price || 0) : 0;
-                         return sum + (price * item.quantity);
-                    }, 0);
+                    // Prices are captured when a medicine is picked; only a page of remedies is loaded
+                    let meds = this.visitMedicines.reduce((sum, item) => sum + (item.price * item.quantity), 0);
                     return fee + meds;
                 }
             },
             methods: {
                 addMedicine() {
-                    if (!this.selectedRemedyId) return;
+                    const r = this.selectedRemedy;
+                    if (!r) return;
                     // Check if already added
-                    let existing = this.visitForm.medicines.find(m => m.remedy_id == this.selectedRemedyId);
+                    let existing = visitMedicineById.get(r.id);
                     if (existing) {
                         existing.quantity++;
                     } else {
-                        this.visitForm.medicines.push({ remedy_id: this.selectedRemedyId, quantity: 1 });
+                        const meds = this.visitMedicines;
+                        meds.push({ remedy_id: r.id, quantity: 1, price: parseFloat(r.current_unit_price || 0) });
+                        // Keep the reactive entry so quantity bumps still re-render
+                        visitMedicineById.set(r.id, meds[meds.length - 1]);
                     }
-                    this.selectedRemedyId = '';
+                    this.selectedRemedy = null;
+                    this.remedySearch = '';
+                },
+                removeMedicine(remedyId) {
+                    // By id, not index: memoized rows keep the handler they were first rendered with
+                    const idx = this.visitMedicines.indexOf(visitMedicineById.get(remedyId));
+                    this.visitMedicines.splice(idx, 1);
+                    visitMedicineById.delete(remedyId);
+                },
+                pickRemedy(r) {
+                    this.selectedRemedy = r;
+                    this.remedySearch = `${r.name} ${r.potency || ''}`;
+                    this.remedySearchOpen = false;
+                },
+                searchRemedies() {
+                    // Typing invalidates any previously picked remedy
+                    this.selectedRemedy = null;
+                    this.debouncedSearch('remedies', this.remedySearch, 'remedyHits');
+                },
+                searchPatients() {
+                    // Typing invalidates any previously picked patient
+                    this.visitForm.patient_id = '';
+                    this.debouncedSearch('patients', this.patientSearch, 'patientHits');
+                },
+                debouncedSearch(kind, text, hitsKey) {
+                    const q = text.trim();
+                    clearTimeout(searchTimers[kind]);
+                    const timer = setTimeout(async () => {
+                        const hits = q ? await this.cachedSearch(kind, q) : [];
+                        // Drop responses for queries the user has already typed past
+                        if (searchTimers[kind] === timer) this[hitsKey] = hits;
+                    }, SEARCH_DELAY);
+                    searchTimers[kind] = timer;
+                },
+                cachedSearch(kind, q) {
+                    const key = `${kind}:${q}`;
+                    let entry = searchCache.get(key);
+                    if (entry && entry.expires > Date.now()) {
+                        searchCache.delete(key); // Re-inserted below as most recent
+                    } else {
+                        searchCache.delete(key);
+                        const hits = this.api(`/api/${kind}?q=${encodeURIComponent(q)}&limit=${SEARCH_LIMITS[kind]}`)
+                            .then(rows => frozenList(rows.map(row => ({ ...row, label: SEARCH_LABELS[kind](row) }))))
+                            .catch(err => {
+                                // Don't cache failures; a retry refetches
+                                if (searchCache.get(key)?.hits === hits) searchCache.delete(key);
+                                throw err;
+                            });
+                        entry = { hits, expires: Date.now() + SEARCH_CACHE_TTL };
+                        if (searchCache.size >= SEARCH_CACHE_SIZE) {
+                            searchCache.delete(searchCache.keys().next().value);
+                        }
+                    }
+                    searchCache.set(key, entry);
+                    return entry.hits;
+                },
+                pickPatient(p) {
+                    this.visitForm.patient_id = p.id;
+                    this.patientSearch = p.label;
+                    this.patientHits = [];
                 },
                 async login() {
+                    inflight.clear();
                     try {
                         const res = await fetch('/api/login', {
                             method: 'POST',
@@ -1265,12 +1535,16 @@ def serve_app():
                     } catch (e) { alert('Login failed'); }
                 },
                 logout() {
+                    inflight.clear();
+                    searchCache.clear();
                     this.token = null;
                     this.userRole = 'staff';
                     localStorage.removeItem('token');
                     localStorage.removeItem('userRole');
                 },
-                async api(url, method='GET', body=null) {
+                api(url, method='GET', body=null) {
+                    const key = `${this.token} ${url}`;
+                    if (method === 'GET' && inflight.has(key)) return inflight.get(key);
                     const opts = {
                         method,
                         headers: { 
@@ -1279,15 +1553,72 @@ def serve_app():
                         }
                     };
                     if (body) opts.body = JSON.stringify(body);
-                    const res = await fetch(url, opts);
-                    return await res.json();
+                    const req = fetch(url, opts).then(res => res.json());
+                    if (method === 'GET') {
+                        inflight.set(key, req);
+                        const settle = () => inflight.delete(key);
+                        req.then(settle, settle);
+                    }
+                    return req;
                 },
                 async loadAll() {
+                    searchCache.clear();
+                    const boot = await this.api(`/api/bootstrap?limit=${PAGE_SIZE}`);
+                    // No stats means an error reply, almost always an expired token
+                    if (!boot.stats) return this.logout();
+                    this.stats = boot.stats;
+                    statsFetchedAt = Date.now();
+                    for (const kind of ['patients', 'remedies', 'visits']) {
+                        this[kind] = frozenList(boot[kind]);
+                        this.cursors[kind] = nextCursor(this[kind]);
+                    }
+                    this.reports.history = frozenList(boot.history);
+                },
+                async loadStats(maxAge = 0) {
+                    // Stale-while-revalidate: the old counters stay on screen until the refresh lands
+                    if (Date.now() - statsFetchedAt < maxAge) return;
+                    statsFetchedAt = Date.now();
                     this.stats = await this.api('/api/stats');
-                    this.patients = await this.api('/api/patients');
-                    this.remedies = await this.api('/api/remedies');
-                    this.visits = await this.api('/api/visits');
-                    this.reports.history = await this.api('/api/reports/history');
+                },
+                async loadHistory() {
+                    this.reports.history = frozenList(await this.api('/api/reports/history'));
+                },
+                async loadFirstPage(kind) {
+                    const page = frozenList(await this.api(`/api/${kind}?limit=${PAGE_SIZE}`));
+                    this[kind] = page;
+                    this.cursors[kind] = nextCursor(page);
+                },
+                upsertRow(kind, row) {
+                    // Mutations hand back the saved row; patch it in rather than refetching every list
+                    searchCache.clear();
+                    const rows = [...this[kind]];
+                    const at = rows.findIndex(r => r.id === row.id);
+                    if (kind === 'remedies') {
+                        // Kept sorted by name; a row past the loaded pages arrives with loadMore
+                        if (at !== -1) rows.splice(at, 1);
+                        const i = rows.findIndex(r => r.name > row.name);
+                        if (i !== -1 || this.cursors.remedies === null) rows.splice(i === -1 ? rows.length : i, 0, row);
+                    } else if (at !== -1) {
+                        rows[at] = row;
+                    } else {
+                        rows.unshift(row); // Newest first
+                    }
+                    this[kind] = frozenList(rows);
+                },
+                async loadMore(kind) {
+                    // A null cursor means the last page has already arrived
+                    const after = this.cursors[kind];
+                    if (after === null || loadingMore.has(kind)) return;
+                    loadingMore.add(kind);
+                    try {
+                        const page = frozenList(await this.api(`/api/${kind}?limit=${PAGE_SIZE}&${cursorQuery(kind, after)}`));
+                        // A row renamed past the cursor comes back on a later page; keep the copy already shown
+                        const shown = new Set(this[kind].map(r => r.id));
+                        this[kind] = frozenList([...this[kind], ...page.filter(r => !shown.has(r.id))]);
+                        this.cursors[kind] = nextCursor(page);
+                    } finally {
+                        loadingMore.delete(kind);
+                    }
                 },
                 openPatientModal(patient = null) {
                     if (patient) {
@@ -1299,41 +1630,32 @@ def serve_app():
                     }
                     this.showPatientModal = true;
                 },
+                async submitPatient(data, id = null) {
+                    // One write path for the patient modal, the quick-add row and the visit modal
+                    const res = await this.api(id ? `/api/patients/${id}` : '/api/patients', id ? 'PUT' : 'POST', data);
+                    if (res.patient) this.upsertRow('patients', res.patient);
+                    return res;
+                },
                 async savePatient() {
-                    const method = this.isEditingPatient ? 'PUT' : 'POST';
-                    const url = this.isEditingPatient ? `/api/patients/${this.patientForm.id}` : '/api/patients';
-                    await this.api(url, method, this.patientForm);
+                    const res = await this.submitPatient(this.patientForm, this.isEditingPatient ? this.patientForm.id : null);
                     this.showPatientModal = false;
-                    this.loadAll();
+                    if (!res.patient) return;
+                    // A rename shows up on the visit cards and in the history report; a new patient only moves the counts
+                    if (this.isEditingPatient) {
+                        this.loadFirstPage('visits');
+                        this.loadHistory();
+                    } else {
+                        this.loadStats();
+                    }
                 },
                 async quickCreatePatient() {
                     if (!this.quickPatient.name) return alert("Name is required");
-                    await this.api('/api/patients', 'POST', this.quickPatient);
+                    const res = await this.submitPatient(this.quickPatient);
                     this.quickPatient = { name: '', nid: '', phone: '', age: '', gender: '' };
-                    this.loadAll();
+                    if (res.patient) this.loadStats();
                     // Refocus name field for rapid entry
                     this.$nextTick(() => this.$refs.quickName.focus());
                 },
-                openRemedyModal(rem = null) {
-                    if (rem) {
-                        this.isEditingRemedy = true;
-                        this.remedyForm = { ...rem }; // Copy data
-                    } else {
-                        this.isEditingRemedy = false;
-                        this.remedyForm = { name: '', potency: '30', description: '', current_unit_price: '', stock_quantity: 0 };
-                    }
-                    this.showRemedyModal = true;
-                },
-                async saveRemedy() {
-                    const method = this.isEditingRemedy ? 'PUT' : 'POST';
-                    const url = this.isEditingRemedy ? `/api/remedies/${this.remedyForm.id}` : '/api/remedies';
-                    
-                    await this.api(url, method, this.remedyForm);
-                    this.showRemedyModal = false;
-                    this.loadAll();
-                },
-                // Alias for old call if needed, or remove createRemedy entirely
-                async createRemedy() { await this.saveRemedy(); },
 
                 openPaymentModal(visit) {
                     this.paymentForm = {
@@ -1345,22 +1667,27 @@ def serve_app():
                     this.showPaymentModal = true;
                 },
                 async savePayment() {
-                    await this.api(`/api/visits/${this.paymentForm.visit_id}/payment`, 'PUT', this.paymentForm);
+                    const res = await this.api(`/api/visits/${this.paymentForm.visit_id}/payment`, 'PUT', this.paymentForm);
                     this.showPaymentModal = false;
-                    this.loadAll();
+                    if (res.visit) this.upsertRow('visits', res.visit);
+                },
+                onRemedySaved(remedy) {
+                    this.upsertRow('remedies', remedy);
+                    this.loadStats();
                 },
 
                 async createVisit() {
                     if (this.isNewPatientForVisit) {
                          if (!this.visitNewPatient.name) return alert("Patient Name is required");
-                         const patientRes = await this.api('/api/patients', 'POST', this.visitNewPatient);
+                         const patientRes = await this.submitPatient(this.visitNewPatient);
                          if (!patientRes.id) return alert("Failed to create patient");
                          this.visitForm.patient_id = patientRes.id;
                     }
                     
                     if (!this.visitForm.patient_id) return alert("Please select or create a patient");
 
-                    await this.api('/api/visits', 'POST', this.visitForm);
+                    const res = await this.api('/api/visits', 'POST', { ...this.visitForm, medicines: this.visitMedicines });
+                    const usedStock = this.visitMedicines.length > 0;
                     this.showVisitModal = false;
                     this.visitForm = { 
                         patient_id: '', 
@@ -1368,24 +1695,106 @@ def serve_app():
                         diagnosis: '', 
                         notes: '', 
                         consultation_fee: 500, 
-                        medicines: [], 
                         amount_paid: 0 
                     };
+                    this.visitMedicines = [];
+                    visitMedicineById.clear();
+                    this.patientSearch = '';
                     this.isNewPatientForVisit = false;
                     this.visitNewPatient = { name: '', phone: '', age: '', gender: '' };
-                    this.loadAll();
+                    if (!res.visit) return;
+                    this.upsertRow('visits', res.visit);
+                    this.loadStats();
+                    this.loadHistory();
+                    // Prescribing draws down stock shown on the inventory cards
+                    if (usedStock) this.loadFirstPage('remedies');
                 },
                 formatDate(str) {
                     if (!str) return '-';
-                    return new Date(str).toLocaleDateString() + ' ' + new Date(str).toLocaleTimeString();
+                    const d = new Date(str);
+                    if (isNaN(d)) return str; // format() throws on an unparseable date
+                    return DATE_FMT.format(d) + ' ' + TIME_FMT.format(d);
                 }
             }
-        }).mount('#app');
+        });
+
+        // Calls the bound handler whenever the element enters the viewport (list windowing sentinels)
+        app.directive('on-visible', {
+            mounted(el, binding) {
+                el._onVisible = binding.value;
+                el._observer = new IntersectionObserver(entries => {
+                    if (entries[0].isIntersecting) el._onVisible();
+                }, { rootMargin: '400px' });
+                el._observer.observe(el);
+            },
+            updated(el, binding) {
+                el._onVisible = binding.value;
+                // Re-observing delivers a fresh entry, so a sentinel still in view keeps loading
+                el._observer.unobserve(el);
+                el._observer.observe(el);
+            },
+            unmounted(el) {
+                el._observer.disconnect();
+            }
+        });
+
+        app.mount('#app');
     </script>
 </body>
 </html>
 """
 
+# Minify before compressing; closing tags are kept so Vue's in-DOM template sees the same tree
+if minify_html:
+    INDEX_HTML = minify_html.minify(
+        INDEX_HTML,
+        minify_css=True,
+        minify_js=True,
+        keep_closing_tags=True,
+    )
+
+# Compress the shell once at import; quality-11 Brotli is far too slow to run per request.
+# <head> and <body> are separate chunks of one stream (sync-flushed in between) so the
+# browser can start on the <head> links before the body bytes arrive.
+_INDEX_HEAD, _HEAD_CLOSE, _INDEX_BODY = INDEX_HTML.partition("</head>")
+_INDEX_HEAD_BYTES = (_INDEX_HEAD + _HEAD_CLOSE).encode("utf-8")
+_INDEX_BODY_BYTES = _INDEX_BODY.encode("utf-8")
+_INDEX_HASH = hashlib.sha256(_INDEX_HEAD_BYTES + _INDEX_BODY_BYTES).hexdigest()[:16]
+
+_gz = zlib.compressobj(9, zlib.DEFLATED, 31)  # wbits=31: gzip container
+_INDEX_CHUNKS = {
+    None: (_INDEX_HEAD_BYTES, _INDEX_BODY_BYTES),
+    "gzip": (_gz.compress(_INDEX_HEAD_BYTES) + _gz.flush(zlib.Z_SYNC_FLUSH),
+             _gz.compress(_INDEX_BODY_BYTES) + _gz.flush()),
+}
+if brotli:
+    _br = brotli.Compressor(quality=11)
+    _INDEX_CHUNKS["br"] = (_br.process(_INDEX_HEAD_BYTES) + _br.flush(),
+                           _br.process(_INDEX_BODY_BYTES) + _br.finish())
+# Strong validators must differ per representation, so each encoding gets its own ETag
+_INDEX_ETAGS = {encoding: f'"{_INDEX_HASH}-{encoding or "id"}"' for encoding in _INDEX_CHUNKS}
+
+async def _stream_chunks(chunks):
+    for chunk in chunks:
+        yield chunk
+
+@app.get("/", response_class=HTMLResponse)
+def serve_app(request: Request):
+    accept = request.headers.get("accept-encoding", "")
+    if "br" in _INDEX_CHUNKS and "br" in accept:
+        encoding = "br"
+    elif "gzip" in accept:
+        encoding = "gzip"
+    else:
+        encoding = None
+
+    headers = {"ETag": _INDEX_ETAGS[encoding], "Vary": "Accept-Encoding"}
+    if _INDEX_ETAGS[encoding] in (tag.strip() for tag in request.headers.get("if-none-match", "").split(",")):
+        return Response(status_code=304, headers=headers)
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return StreamingResponse(_stream_chunks(_INDEX_CHUNKS[encoding]), media_type="text/html", headers=headers)
+
 if __name__ == "__main__":
     import uvicorn
     # Initialize DB every time app starts
@@ -0,0 +1,117 @@
+// Inventory view: fetched on first visit so login and dashboard don't pay for its template
+export default {
+    props: ['remedies', 'hasMore', 'userRole', 'api'],
+    emits: ['saved', 'load-more'],
+    data() {
+        return {
+            showRemedyModal: false,
+            isEditingRemedy: false,
+            remedyForm: { id: null, name: '', potency: '30', description: '', current_unit_price: '', stock_quantity: 0 }
+        }
+    },
+    methods: {
+        openRemedyModal(rem = null) {
+            if (rem) {
+                this.isEditingRemedy = true;
+                this.remedyForm = { ...rem }; // Copy data
+            } else {
+                this.isEditingRemedy = false;
+                this.remedyForm = { name: '', potency: '30', description: '', current_unit_price: '', stock_quantity: 0 };
+            }
+            this.showRemedyModal = true;
+        },
+        async saveRemedy() {
+            const method = this.isEditingRemedy ? 'PUT' : 'POST';
+            const url = this.isEditingRemedy ? `/api/remedies/${this.remedyForm.id}` : '/api/remedies';
+
+            const res = await this.api(url, method, this.remedyForm);
+            this.showRemedyModal = false;
+            if (res.remedy) this.$emit('saved', res.remedy);
+        }
+    },
+    template: `
+        <div class="max-w-7xl mx-auto">
+            <div class="flex justify-between items-center mb-6">
+                <h2 class="text-3xl font-bold text-emerald-900">Medicine Inventory</h2>
+                <button v-if="['admin','doctor'].includes(userRole)" @click="openRemedyModal()" class="bg-emerald-600 hover:bg-emerald-700 text-white px-6 py-2 rounded-lg font-bold shadow-md transition flex items-center gap-2">
+                    <i class="fas fa-leaf"></i> Add Remedy
+                </button>
+            </div>
+
+            <!-- Add/Edit Remedy Modal -->
+            <teleport to="body">
+                <div v-show="showRemedyModal" class="fixed inset-0 bg-emerald-900/50 backdrop-blur-sm flex items-center justify-center z-50 p-4">
+                    <div class="bg-white p-8 rounded-2xl w-full max-w-lg shadow-2xl border border-green-100">
+                        <h3 class="text-xl font-bold mb-6 text-gray-800 border-b border-gray-100 pb-2">
+                            {{ isEditingRemedy ? 'Edit Remedy' : 'Add To Inventory' }}
+                        </h3>
+                        <form @submit.prevent="saveRemedy" class="space-y-4">
+                            <div>
+                                <label class="block text-sm font-medium text-gray-700 mb-1">Medicine Name</label>
+                                <input v-model="remedyForm.name" placeholder="E.g. Arnica Mont" required class="w-full bg-gray-50 border border-gray-200 p-3 rounded-lg focus:outline-none focus:border-green-500 focus:ring-1 focus:ring-green-500 transition">
+                            </div>
+                            <div class="grid grid-cols-2 gap-4">
+                                <div>
+                                    <label class="block text-sm font-medium text-gray-700 mb-1">Potency</label>
+                                    <select v-model="remedyForm.potency" class="w-full bg-gray-50 border border-gray-200 p-3 rounded-lg focus:outline-none focus:border-green-500 focus:ring-1 focus:ring-green-500 transition">
+                                        <option value="30">30</option>
+                                        <option value="200">200</option>
+                                        <option value="1X">1X</option>
+                                        <option value="6X">6X</option>
+                                        <option value="12X">12X</option>
+                                        <option value="60">60</option>
+                                    </select>
+                                </div>
+                                <div>
+                                    <label class="block text-sm font-medium text-gray-700 mb-1">Stock Qty</label>
+                                    <input v-model="remedyForm.stock_quantity" type="number" placeholder="0" class="w-full bg-gray-50 border border-gray-200 p-3 rounded-lg focus:outline-none focus:border-green-500 focus:ring-1 focus:ring-green-500 transition">
+                                </div>
+                            </div>
+                            <div>
+                                <label class="block text-sm font-medium text-gray-700 mb-1">Unit Price (BDT)</label>
+                                <input v-model="remedyForm.current_unit_price" type="number" step="0.01" class="w-full bg-gray-50 border border-gray-200 p-3 rounded-lg focus:outline-none focus:border-green-500 focus:ring-1 focus:ring-green-500 transition">
+                            </div>
+                            <div>
+                                <label class="block text-sm font-medium text-gray-700 mb-1">Description / Indications</label>
+                                <textarea v-model="remedyForm.description" placeholder="Usage instructions..." class="w-full bg-gray-50 border border-gray-200 p-3 rounded-lg focus:outline-none focus:border-green-500 focus:ring-1 focus:ring-green-500 transition h-24"></textarea>
+                            </div>
+                            <div class="flex justify-end gap-3 mt-6 pt-4 border-t border-gray-100">
+                                <button type="button" @click="showRemedyModal = false" class="px-5 py-2 text-gray-500 hover:text-gray-700 font-medium">Cancel</button>
+                                <button type="submit" class="bg-emerald-600 hover:bg-emerald-700 text-white px-6 py-2 rounded-lg font-bold shadow transition">{{ isEditingRemedy ? 'Update' : 'Add Item' }}</button>
+                            </div>
+                        </form>
+                    </div>
+                </div>
+            </teleport>
+
+            <div class="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6">
+                <div v-for="r in remedies" :key="r.id" class="offscreen-skip bg-white p-5 rounded-xl border border-green-100 shadow-sm hover:shadow-lg hover:border-green-300 transition relative group flex flex-col h-full">
+                    <button v-if="['admin','doctor'].includes(userRole)" @click="openRemedyModal(r)" class="absolute top-3 right-3 bg-gray-100 text-gray-500 hover:bg-emerald-600 hover:text-white p-2 w-8 h-8 flex items-center justify-center rounded-full transition opacity-0 group-hover:opacity-100 shadow-sm z-10">
+                        <i class="fas fa-edit text-xs"></i>
+                    </button>
+
+                    <div class="flex items-center gap-3 mb-3">
+                        <div class="w-10 h-10 rounded-full bg-green-50 text-green-600 flex items-center justify-center border border-green-100">
+                            <i class="fas fa-flask"></i>
+                        </div>
+                        <div>
+                            <h4 class="font-bold text-lg text-gray-800 leading-tight">{{ r.name }}</h4>
+                            <span class="bg-emerald-100 text-emerald-800 px-2 py-0.5 rounded text-[10px] font-bold uppercase tracking-wider">{{ r.potency }}</span>
+                        </div>
+                    </div>
+
+                    <p class="text-sm text-gray-500 mb-4 h-12 overflow-hidden line-clamp-2 leading-relaxed">{{ r.description }}</p>
+
+                    <div class="mt-auto flex justify-between items-center text-sm pt-4 border-t border-gray-50">
+                        <span class="stock-badge text-gray-500 bg-gray-50 px-2 py-1 rounded" :class="{ 'low-stock': r.stock_quantity < 10 }">
+                            Stock: {{ r.stock_quantity }}
+                        </span>
+                        <span class="font-bold text-emerald-700 text-base">BDT {{ r.current_unit_price }}</span>
+                    </div>
+                </div>
+            </div>
+            <!-- Sentinel: asks the app for the next page of remedies as it scrolls into view -->
+            <div v-if="hasMore" v-on-visible="() => $emit('load-more')" class="h-8"></div>
+        </div>
+    `
+};